@@ -7,5 +7,5 @@ from app import __main__, __metadata__, applets, asgi, config, utils
 
 __all__ = ("applets", "config", "__main__", "__metadata__", "utils", "asgi")
 
-if platform.system() == "Darwin":
+if platform.system() == "Darwin" and multiprocessing.get_start_method(allow_none=True) != "fork":
     multiprocessing.set_start_method("fork", force=True)
@@ -1,20 +1,152 @@
 """Core controller."""
 
+from __future__ import annotations
+
+import gzip
+import hashlib
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Annotated, NamedTuple
+
 import msgspec
-from litestar import Controller, Request, get, post
+from litestar import Controller, MediaType, Request, Response, get, post
 from litestar.contrib.htmx.response import HTMXTemplate
+from litestar.datastructures import CacheControlHeader
+from litestar.enums import RequestEncodingType
 from litestar.exceptions import ValidationException
+from litestar.openapi.datastructures import ResponseSpec
+from litestar.params import Body
 from litestar.response import Template
-from pygments import highlight
-from pygments.formatters.html import HtmlFormatter
-from pygments.lexers.shell import BashLexer
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
 from structlog import get_logger
 
-from app.applets.core.helpers import get_versions_from_db
-from app.applets.core.schemas import ScriptData, Version
+from app.applets.core.helpers import get_versions_for_api, get_versions_for_template
+from app.applets.core.schemas import ScriptData, Version, script_data_from_form
+
+if TYPE_CHECKING:
+    from litestar.template import TemplateProtocol
+    from pygments.formatters.html import HtmlFormatter
+    from pygments.lexers.shell import BashLexer
 
 logger = get_logger(__name__)
 
+_VERSIONS_ENCODER = msgspec.json.Encoder()
+
+
+class _Pygments(NamedTuple):
+    """Pygments objects shared by every highlighted script."""
+
+    lexer: BashLexer
+    formatter_with_lines: HtmlFormatter
+    formatter_for_copy: HtmlFormatter
+
+
+@cache
+def _load_pygments() -> _Pygments:
+    """Import Pygments and build the shared lexer and formatters.
+
+    Pygments is slow to import, so this is deferred until the first script is generated.
+
+    Returns:
+        _Pygments: The shared Pygments objects.
+    """
+    from pygments.formatters.html import HtmlFormatter
+    from pygments.lexers.shell import BashLexer
+
+    return _Pygments(
+        lexer=BashLexer(),
+        formatter_with_lines=HtmlFormatter(linenos=True, cssclass="source"),
+        formatter_for_copy=HtmlFormatter(linenos=False, cssclass="source-no-lines"),
+    )
+
+
+class _Stylesheet(NamedTuple):
+    """The Pygments stylesheet, ready to be served."""
+
+    content: bytes
+    gzipped: bytes
+    etag: str
+
+
+@cache
+def _load_stylesheet() -> _Stylesheet:
+    """Build the Pygments stylesheet along with its gzipped body and ETag.
+
+    Returns:
+        _Stylesheet: The stylesheet.
+    """
+    from pygments.formatters.html import HtmlFormatter
+
+    content = HtmlFormatter(style="friendly").get_style_defs(".source").encode()
+    return _Stylesheet(
+        content=content,
+        gzipped=gzip.compress(content, 9),
+        etag=f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"',
+    )
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an ``Accept-Encoding`` header allows a gzip response.
+
+    Args:
+        accept_encoding (str): The ``Accept-Encoding`` header value.
+
+    Returns:
+        bool: True if ``gzip`` (or ``*``) is listed with a non-zero quality value.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0))) > 0
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag, using weak comparison.
+
+    Args:
+        if_none_match (str): The ``If-None-Match`` header value.
+        etag (str): The current ETag.
+
+    Returns:
+        bool: True if the header is ``*`` or lists the ETag.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+@lru_cache(maxsize=512)
+def _render_and_highlight(template: TemplateProtocol, script_data: ScriptData) -> tuple[str, str]:
+    """Render the build script and highlight it with Pygments.
+
+    The options form only has a handful of inputs, so results are memoized per template and script data.
+
+    Args:
+        template (TemplateProtocol): The ``partials/script.html`` template.
+        script_data (ScriptData): The options to render the script with.
+
+    Returns:
+        tuple[str, str]: The highlighted script with line numbers and the highlighted script for copying.
+    """
+    from pygments import format as format_tokens
+
+    pygments = _load_pygments()
+    script_content = template.render(script_data=script_data)
+    # Both renderings share one lexing pass; only the formatter differs.
+    tokens = list(pygments.lexer.get_tokens(script_content))
+    return (
+        format_tokens(tokens, pygments.formatter_with_lines),
+        format_tokens(tokens, pygments.formatter_for_copy),
+    )
+
 
 class CoreController(Controller):
     """Houses all routes for core endpoints."""
@@ -28,68 +160,76 @@ class CoreController(Controller):
         Returns:
             Template: Index page.
         """
-        python_versions = await get_versions_from_db()
+        python_versions = await get_versions_for_template()
         return Template(template_name="index.html", context={"python_versions": python_versions})
 
-    @get("/api/versions")
-    async def list_versions(self) -> list[Version]:
+    @get("/static/pygments.css", include_in_schema=False, cache_control=CacheControlHeader(max_age=86400, public=True))
+    async def pygments_css(self, request: Request) -> Response[bytes]:
+        """Serve the Pygments stylesheet used by highlighted scripts.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            Response[bytes]: The stylesheet, gzipped when the client accepts it.
+        """
+        stylesheet = _load_stylesheet()
+        headers = {"ETag": stylesheet.etag, "Vary": "Accept-Encoding"}
+        if _etag_matches(request.headers.get("if-none-match", ""), stylesheet.etag):
+            return Response(content=b"", status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+        if _accepts_gzip(request.headers.get("accept-encoding", "")):
+            return Response(
+                content=stylesheet.gzipped,
+                media_type="text/css",
+                headers={**headers, "Content-Encoding": "gzip"},
+            )
+        return Response(content=stylesheet.content, media_type="text/css", headers=headers)
+
+    @get(
+        "/api/versions",
+        responses={
+            200: ResponseSpec(
+                data_container=list[Version], description="List of all versions.", generate_examples=False
+            )
+        },
+    )
+    async def list_versions(self) -> Response[bytes]:
         """List all versions available in the database.
 
         Returns:
-            list[Version]: List of all players.
+            Response[bytes]: List of all versions, encoded as JSON.
         """
-        return await get_versions_from_db()
+        return Response(content=_VERSIONS_ENCODER.encode(await get_versions_for_api()), media_type=MediaType.JSON)
 
     @post("/api/generate-script")
-    async def generate_script(self, request: Request, script_data: ScriptData | None = None) -> HTMXTemplate:
+    async def generate_script(
+        self,
+        request: Request,
+        data: Annotated[dict[str, str], Body(media_type=RequestEncodingType.URL_ENCODED)],
+    ) -> HTMXTemplate:
         """Generate a script based on the provided data and apply Pygments highlighting.
 
-        TODO: use multipart body instead of raw dogging the request and parsing...
-
         Args:
             request (Request): The incoming request.
-            script_data (ScriptData, optional): Placeholder to render ScriptData model in OpenAPI docs
+            data (dict[str, str]): The submitted script options form.
 
         Returns:
             HTMXTemplate: The highlighted script.
         """
-        form_data = await request.form()
-        data_dict = {
-            key: (
-                value == "on"
-                if isinstance(ScriptData.__annotations__[key], type)
-                and issubclass(ScriptData.__annotations__[key], bool)
-                else value or ""
-            )
-            for key, value in form_data.items()
-            if key in ScriptData.__annotations__
-        }
-        if not data_dict.get("selectedVersion"):
+        if not data.get("selectedVersion"):
             msg = "Python version must be selected"
             raise ValidationException(msg)
 
-        try:
-            script_data = msgspec.convert(data_dict, type=ScriptData)
-        except msgspec.ValidationError as e:
-            raise ValidationException(str(e)) from e
-
-        script_content = request.app.template_engine.get_template("partials/script.html").render(
-            script_data=script_data
-        )
-        highlighted_script_with_lines = highlight(
-            script_content, BashLexer(), HtmlFormatter(linenos=True, cssclass="source")
-        )
-        highlighted_script_for_copy = highlight(
-            script_content, BashLexer(), HtmlFormatter(linenos=False, cssclass="source-no-lines")
+        script_data = script_data_from_form(data)
+        highlighted_script_with_lines, highlighted_script_for_copy = _render_and_highlight(
+            request.app.state.script_template, script_data
         )
-        pygments_css = HtmlFormatter(style="friendly").get_style_defs(".source")
 
         return HTMXTemplate(
             template_name="partials/highlighted_script.html",
             context={
                 "highlighted_script": highlighted_script_with_lines,
                 "highlighted_script_for_copy": highlighted_script_for_copy,
-                "pygments_css": pygments_css,
                 "script_data": script_data,
             },
         )
@@ -4,14 +4,14 @@ Parts borrowed from https://github.com/python/cpython-devcontainers/blob/main/cp
 """
 
 import asyncio
-import sqlite3
-from contextlib import contextmanager
+import re
 from datetime import UTC, date, datetime
 
 import aiosqlite
 import httpx
+import msgspec
+from litestar import Litestar
 from litestar.config.app import AppConfig
-from packaging import version as pkg_version
 from structlog import get_logger
 
 from app.applets.core.schemas import Version
@@ -19,31 +19,29 @@ from app.applets.core.schemas import Version
 logger = get_logger(__name__)
 
 ACTIVE_VERSIONS = ["3.9", "3.10", "3.11", "3.12", "3.13"]
+_ACTIVE = frozenset(ACTIVE_VERSIONS)
 PRE_RELEASE = "3.14.0a0"
 DATABASE_FILE = "python_versions.db"
 
+type VersionTuple = tuple[int, int, int, tuple[str, int] | None]
+"""``(major, minor, micro, pre-release)``, where the pre-release is e.g. ``("rc", 1)`` or ``None`` for finals."""
 
-@contextmanager
-def get_db_connection() -> sqlite3.Connection:
-    """Get a database connection.
+_TAG_PREFIX = "refs/tags/v"
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)(?:(a|b|rc)(\d+))?")
 
-    Yields:
-        A database connection.
-    """
-    conn = sqlite3.connect(DATABASE_FILE)
-    try:
-        yield conn
-        conn.commit()
-    finally:
-        conn.close()
+_VERSIONS_DECODER = msgspec.json.Decoder(list[Version])
+_VERSIONS_CACHE: list[Version] | None = None
+_TEMPLATE_VERSIONS_CACHE: list[dict[str, str]] | None = None
+_VERSIONS_LOCK = asyncio.Lock()
+_HTTP_CLIENT: httpx.AsyncClient | None = None
 
 
-def initialize_database() -> None:
+async def initialize_database() -> None:
     """Initialize the database."""
     logger.debug("initializing database")
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
+    async with aiosqlite.connect(DATABASE_FILE) as db:
+        await db.executescript("""
+            PRAGMA journal_mode=WAL;
             CREATE TABLE IF NOT EXISTS python_versions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT UNIQUE,
@@ -52,9 +50,58 @@ def initialize_database() -> None:
                 patch INTEGER,
                 level TEXT,
                 status TEXT,
-                last_updated TIMESTAMP
-            )
+                last_updated INTEGER
+            );
+            -- Convert ISO 8601 timestamps written before they were stored as epoch seconds.
+            UPDATE python_versions
+            SET last_updated = CAST(strftime('%s', last_updated) AS INTEGER)
+            WHERE typeof(last_updated) = 'text';
+            -- Drop rows whose timestamp could not be parsed; the startup refresh rewrites them.
+            DELETE FROM python_versions WHERE last_updated IS NULL;
         """)
+        await db.commit()
+
+
+async def open_http_client() -> None:
+    """Create the shared HTTP client used for upstream API calls."""
+    global _HTTP_CLIENT  # noqa: PLW0603
+    _HTTP_CLIENT = httpx.AsyncClient(
+        timeout=30.0,
+        headers={"User-Agent": "Python-Versions-Applet"},
+        limits=httpx.Limits(max_keepalive_connections=4),
+    )
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _HTTP_CLIENT  # noqa: PLW0603
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client.
+
+    Returns:
+        httpx.AsyncClient: The client opened by :func:`open_http_client`.
+
+    Raises:
+        RuntimeError: If the client is not open, i.e. outside the application lifespan.
+    """
+    if _HTTP_CLIENT is None:
+        msg = "HTTP client is not open; it is only available while the application is running"
+        raise RuntimeError(msg)
+    return _HTTP_CLIENT
+
+
+def load_script_template(app: Litestar) -> None:
+    """Resolve the build script template once and keep it on the application state.
+
+    Args:
+        app: The Litestar application instance.
+    """
+    app.state.script_template = app.template_engine.get_template("partials/script.html")
 
 
 async def start_periodic_update() -> None:
@@ -84,24 +131,19 @@ async def get_tags_from_github() -> list[dict]:
     Returns:
         list[dict]: A list of tags.
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://api.github.com/repos/python/cpython/git/refs/tags",
-                timeout=30.0,
-                headers={"User-Agent": "Python-Versions-Applet"},
-            )
-
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError:
-            return []
-        except httpx.RequestError as e:
-            logger.exception("An error occurred while requesting %s", e.request.url)
-            return []
-        except Exception:
-            logger.exception("An unexpected error occurred")
-            return []
+    client = _get_http_client()
+    try:
+        response = await client.get("https://api.github.com/repos/python/cpython/git/refs/tags")
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError:
+        return []
+    except httpx.RequestError as e:
+        logger.exception("An error occurred while requesting %s", e.request.url)
+        return []
+    except Exception:
+        logger.exception("An unexpected error occurred")
+        return []
 
 
 async def get_version_eols() -> dict[str, date]:
@@ -110,44 +152,70 @@ async def get_version_eols() -> dict[str, date]:
     Returns:
         dict[str, date]: A dictionary
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get("https://endoflife.date/api/python.json")
-        response.raise_for_status()
-        data = response.json()
-        return {release["cycle"]: date.fromisoformat(release["eol"]) for release in data}
+    response = await _get_http_client().get("https://endoflife.date/api/python.json")
+    response.raise_for_status()
+    data = response.json()
+    return {release["cycle"]: date.fromisoformat(release["eol"]) for release in data}
 
 
-def get_version_from_tags(tags: list[dict]) -> list[pkg_version.Version]:
+def parse_version(version: str) -> VersionTuple | None:
+    """Parse a ``X.Y.Z`` or ``X.Y.Z{a,b,rc}N`` version string.
+
+    Args:
+        version (str): The version string.
+
+    Returns:
+        VersionTuple | None: The parsed version, or ``None`` if the string is not a release version.
+    """
+    match = _VERSION_RE.fullmatch(version)
+    if match is None:
+        return None
+    major, minor, micro, pre_level, pre_number = match.groups()
+    pre = (pre_level, int(pre_number)) if pre_level else None
+    return int(major), int(minor), int(micro), pre
+
+
+def _release_order(version: VersionTuple) -> tuple[int, int, int, bool, tuple[str, int]]:
+    """Sort key that orders pre-releases before the final release of the same version."""
+    major, minor, micro, pre = version
+    return major, minor, micro, pre is None, pre or ("", 0)
+
+
+def get_version_from_tags(tags: list[dict]) -> list[VersionTuple]:
     """Get the Python versions from the GitHub tags.
 
     Args:
         tags (list[dict]): A list of tags from the GitHub API.
 
     Returns:
-        list[pkg_version.Version]: A list of Version objects.
+        list[VersionTuple]: A list of parsed versions.
     """
-    return [
-        pkg_version.parse(item.get("ref").replace("refs/tags/v", ""))
-        for item in tags
-        if item.get("ref", "").startswith("refs/tags/v")
-    ]
+    versions = []
+    for item in tags:
+        ref = item.get("ref", "")
+        if ref.startswith(_TAG_PREFIX) and (version := parse_version(ref.removeprefix(_TAG_PREFIX))) is not None:
+            versions.append(version)
+    return versions
 
 
-def get_latest_version(all_versions: list[pkg_version.Version]) -> dict[str, pkg_version.Version]:
-    """Get the latest Python versions for each series.
+def get_latest_version(all_versions: list[VersionTuple]) -> dict[str, VersionTuple]:
+    """Get the latest Python versions for each active series.
 
     Args:
-        all_versions (list[pkg_version.Version]): A list of Version objects.
+        all_versions (list[VersionTuple]): A list of parsed versions.
 
     Returns:
-        dict[str, pkg_version.Version]: A dictionary of the latest versions.
+        dict[str, VersionTuple]: A dictionary of the latest versions.
     """
-    latest = {}
+    latest: dict[str, VersionTuple] = {}
     for version in all_versions:
-        series = f"{version.major}.{version.minor}"
-        if series in latest and latest.get(series) < version or series not in latest:
+        series = f"{version[0]}.{version[1]}"
+        if series not in _ACTIVE:
+            continue
+        current = latest.get(series)
+        if current is None or _release_order(current) < _release_order(version):
             latest[series] = version
-    return {key: value for key, value in latest.items() if key in ACTIVE_VERSIONS}
+    return latest
 
 
 async def update_versions_in_db(versions: list[Version]) -> None:
@@ -156,85 +224,151 @@ async def update_versions_in_db(versions: list[Version]) -> None:
     Args:
         versions (list[Version]): A list of Version objects to update.
     """
-    async with aiosqlite.connect(DATABASE_FILE) as db:
-        await db.executemany(
-            """
-            INSERT OR REPLACE INTO python_versions
-            (name, major, minor, patch, level, status, last_updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            [(v.name, v.major, v.minor, v.patch, v.level, v.status, v.last_updated.isoformat()) for v in versions],
-        )
-        await db.commit()
+    global _VERSIONS_CACHE, _TEMPLATE_VERSIONS_CACHE  # noqa: PLW0603
+    if not versions:
+        return
+    placeholders = ", ".join(["(?, ?, ?, ?, ?, ?, ?)"] * len(versions))
+    params = [
+        param
+        for v in versions
+        for param in (v.name, v.major, v.minor, v.patch, v.level, v.status, int(v.last_updated.timestamp()))
+    ]
+    # Hold the cache lock so a concurrent read cannot publish rows from before this write.
+    async with _VERSIONS_LOCK:
+        async with aiosqlite.connect(DATABASE_FILE) as db:
+            await db.execute("PRAGMA synchronous=NORMAL")
+            await db.execute(
+                f"""
+                INSERT OR REPLACE INTO python_versions
+                (name, major, minor, patch, level, status, last_updated)
+                VALUES {placeholders}
+            """,  # noqa: S608
+                params,
+            )
+            await db.commit()
+        _VERSIONS_CACHE = _TEMPLATE_VERSIONS_CACHE = None
 
 
-async def get_versions_from_db() -> list[Version]:
+async def get_versions_for_api() -> list[Version]:
     """Get the latest Python versions from the database.
 
+    The table only changes when :func:`update_versions_in_db` runs, so the decoded list is kept in memory
+    until that happens.
+
     Returns:
         list[Version]: A list of Version objects.
     """
-    async with aiosqlite.connect(DATABASE_FILE) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute("""
-            SELECT * FROM python_versions
-            ORDER BY major DESC, minor DESC, patch DESC
-        """) as cursor:
-            rows = await cursor.fetchall()
-    return [
-        Version(
-            name=row["name"],
-            major=row["major"],
-            minor=row["minor"],
-            patch=row["patch"],
-            level=row["level"],
-            status=row["status"],
-            last_updated=datetime.fromisoformat(row["last_updated"]),
-        )
-        for row in rows
-    ]
+    global _VERSIONS_CACHE  # noqa: PLW0603
+    if _VERSIONS_CACHE is not None:
+        return _VERSIONS_CACHE
+    async with _VERSIONS_LOCK:
+        if _VERSIONS_CACHE is None:
+            _VERSIONS_CACHE = await _query_versions()
+    return _VERSIONS_CACHE
+
+
+async def get_versions_for_template() -> list[dict[str, str]]:
+    """Get the name and full version of the latest Python versions for rendering.
+
+    Templates only read a couple of attributes, so rows are handed over as plain mappings rather than
+    :class:`Version` structs. Cached alongside :func:`get_versions_for_api`.
+
+    Returns:
+        list[dict[str, str]]: A list of ``name``/``full_version`` mappings.
+    """
+    global _TEMPLATE_VERSIONS_CACHE  # noqa: PLW0603
+    if _TEMPLATE_VERSIONS_CACHE is not None:
+        return _TEMPLATE_VERSIONS_CACHE
+    async with _VERSIONS_LOCK:
+        if _TEMPLATE_VERSIONS_CACHE is None:
+            async with aiosqlite.connect(DATABASE_FILE) as db:
+                db.row_factory = aiosqlite.Row
+                async with db.execute("""
+                    SELECT name, major || '.' || minor || '.' || patch AS full_version
+                    FROM python_versions
+                    ORDER BY major DESC, minor DESC, patch DESC
+                """) as cursor:
+                    rows = await cursor.fetchall()
+            _TEMPLATE_VERSIONS_CACHE = [dict(row) for row in rows]
+    return _TEMPLATE_VERSIONS_CACHE
+
+
+async def _query_versions() -> list[Version]:
+    """Query the Python versions table.
+
+    Rows are aggregated into a single JSON array by SQLite and decoded in one pass by msgspec.
+
+    Returns:
+        list[Version]: A list of Version objects.
+    """
+    async with (
+        aiosqlite.connect(DATABASE_FILE) as db,
+        db.execute("""
+            SELECT json_group_array(json_object(
+                'name', name,
+                'major', major,
+                'minor', minor,
+                'patch', patch,
+                'level', level,
+                'status', status,
+                'last_updated', strftime('%Y-%m-%dT%H:%M:%SZ', last_updated, 'unixepoch')
+            ))
+            FROM (
+                SELECT * FROM python_versions
+                ORDER BY major DESC, minor DESC, patch DESC
+            )
+            """) as cursor,
+    ):
+        row = await cursor.fetchone()
+    # An aggregate query always yields one row; this only guards the ``Row | None`` return type.
+    if row is None:
+        return []
+    return _VERSIONS_DECODER.decode(row[0])
 
 
 async def fetch_and_update_versions() -> None:
     """Fetch the latest Python versions from GitHub and update the database."""
     try:
-        gh_response = await get_tags_from_github()
+        gh_response, version_eols = await asyncio.gather(get_tags_from_github(), get_version_eols())
         all_versions = get_version_from_tags(gh_response)
         latest_versions = get_latest_version(all_versions)
-        version_eols = await get_version_eols()
 
-        today = datetime.now(tz=UTC).date()
+        now = datetime.now(UTC)
+        today = now.date()
         versions_to_update = []
 
-        for key, value in latest_versions.items():
-            if not value.is_prerelease:
+        for key, (major, minor, micro, pre) in latest_versions.items():
+            if pre is None:
                 eol = version_eols.get(key)
                 if eol is None or today <= eol:
                     status = "feature" if eol is None else "bugfix"
                     versions_to_update.append(
                         Version(
-                            name=f"Python {value.major}.{value.minor}.{value.micro}",
-                            major=value.major,
-                            minor=value.minor,
-                            patch=value.micro,
+                            name=f"Python {major}.{minor}.{micro}",
+                            major=major,
+                            minor=minor,
+                            patch=micro,
                             level="final",
                             status=status,
-                            last_updated=datetime.now(UTC),
+                            last_updated=now,
                         )
                     )
 
         # Add the pre-release version if specified
-        if PRE_RELEASE:
-            pre_version = pkg_version.parse(PRE_RELEASE)
+        pre_release = parse_version(PRE_RELEASE) if PRE_RELEASE else None
+        if PRE_RELEASE and pre_release is None:
+            logger.warning("Ignoring malformed PRE_RELEASE version %r", PRE_RELEASE)
+        if pre_release is not None:
+            major, minor, micro, _ = pre_release
             versions_to_update.append(
                 Version(
-                    name=f"Python {pre_version.major}.{pre_version.minor}.{pre_version.micro}",
-                    major=pre_version.major,
-                    minor=pre_version.minor,
-                    patch=pre_version.micro,
+                    name=f"Python {major}.{minor}.{micro}",
+                    major=major,
+                    minor=minor,
+                    patch=micro,
                     level="alpha",
                     status="prerelease",
-                    last_updated=datetime.now(UTC),
+                    last_updated=now,
                 )
             )
 
@@ -251,12 +385,12 @@ async def get_python_versions() -> list[Version]:
     Returns:
         list[Version]: A list of Version objects.
     """
-    db_versions = await get_versions_from_db()
+    db_versions = await get_versions_for_api()
 
     if not db_versions or (datetime.now(UTC) - db_versions[0].last_updated).days > 1:
         logger.info("fetching python versions")
         await fetch_and_update_versions()
-        db_versions = await get_versions_from_db()
+        db_versions = await get_versions_for_api()
 
     return db_versions
 
@@ -272,6 +406,8 @@ def generate_app_config(app_config: AppConfig) -> AppConfig:
     Returns:
         AppConfig: The updated AppConfig instance.
     """
-    initialize_database()
-    app_config.on_startup.append(start_periodic_update)
+    app_config.on_startup.extend(
+        [initialize_database, load_script_template, open_http_client, start_periodic_update],
+    )
+    app_config.on_shutdown.append(close_http_client)
     return app_config
@@ -1,7 +1,8 @@
 """Structures for the core applets."""
 
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
 import msgspec
 
@@ -23,7 +24,7 @@ class Version(msgspec.Struct):
         return f"{self.major}.{self.minor}.{self.patch}"
 
 
-class ScriptData(msgspec.Struct):
+class ScriptData(msgspec.Struct, frozen=True):
     """Schema for the script data."""
 
     selectedVersion: str = "3.13.0"
@@ -37,3 +38,28 @@ class ScriptData(msgspec.Struct):
     addSoftLinks: bool = False
     disableGIL: bool = False
     enableJIT: bool = False
+
+
+_BOOL_FIELDS = frozenset(name for name, hint in ScriptData.__annotations__.items() if hint is bool)
+_CHECKED = frozenset({"on", "true", "1"})
+"""Submitted checkbox values that count as ticked. Browsers send ``on`` unless the input sets a ``value``."""
+
+
+def script_data_from_form(form: Mapping[str, str]) -> ScriptData:
+    """Build script data from the submitted options form.
+
+    Unticked checkboxes are left out of the form entirely, so every boolean field is set from whether its
+    checkbox was submitted as ticked. Other fields missing from the form keep their defaults.
+
+    Args:
+        form (Mapping[str, str]): The submitted form fields.
+
+    Returns:
+        ScriptData: The script options.
+    """
+    values: dict[str, Any] = {
+        name: form.get(name) in _CHECKED if name in _BOOL_FIELDS else form[name]
+        for name in ScriptData.__struct_fields__
+        if name in _BOOL_FIELDS or name in form
+    }
+    return ScriptData(**values)
@@ -81,7 +81,7 @@ openapi_config = OpenAPIConfig(
     ],
 )
 template_config = TemplateConfig(
-    directory=get_template_directories(),
+    directory=list(get_template_directories()),
     engine=settings.template.ENGINE,
 )
 
@@ -7,56 +7,118 @@ from __future__ import annotations
 
 import binascii
 import os
-from dataclasses import dataclass, field
-from functools import lru_cache
+import re
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Final
 
 from litestar.contrib.jinja import JinjaTemplateEngine
 from litestar.utils.module_loader import module_to_os_path
+from msgspec import Struct, field
 
 if TYPE_CHECKING:
     from litestar.data_extractors import RequestExtractorField, ResponseExtractorField
 
 DEFAULT_MODULE_NAME = "app"
 BASE_DIR: Final[Path] = module_to_os_path(DEFAULT_MODULE_NAME)
+_BUNDLE_DIR: Final[Path] = BASE_DIR / "applets" / "core" / "public"
+_RESOURCE_DIR: Final[Path] = Path("resources")
+_TEMPLATE_DIR: Final[Path] = BASE_DIR / "applets" / "core" / "templates"
 
-TRUE_VALUES = {"True", "true", "1", "yes", "Y", "T"}
+_ENV: Final = os.environ
+TRUE_VALUES: Final[frozenset[str]] = frozenset({"true", "1", "yes", "y", "t"})
 
+# https://stackoverflow.com/a/1845097/6560549
+_NEVER_MATCH: Final[re.Pattern[str]] = re.compile(r"\A(?!x)x")
+_OBFUSCATE_COOKIES: Final[frozenset[str]] = frozenset({"session"})
+_OBFUSCATE_HEADERS: Final[frozenset[str]] = frozenset({"authorization", "x-api-key"})
+_REQUEST_FIELDS: Final[tuple[RequestExtractorField, ...]] = (
+    "path",
+    "method",
+    "headers",
+    "cookies",
+    "query",
+    "path_params",
+    "body",
+)
+_RESPONSE_FIELDS: Final[tuple[ResponseExtractorField, ...]] = (
+    "status_code",
+    "cookies",
+    "headers",
+    "body",
+)
 
-@dataclass
-class ViteSettings:
+
+@cache
+def _generate_secret_key() -> str:
+    """Generate a random secret key, only when one is first needed."""
+    return binascii.hexlify(os.urandom(32)).decode(encoding="utf-8")
+
+
+def _env_str(name: str, default: str) -> str:
+    """Read a string setting from the environment."""
+    return _ENV.get(name, default)
+
+
+def _env_bool(name: str, *, default: bool) -> bool:
+    """Read a boolean setting from the environment."""
+    value = _ENV.get(name)
+    return default if value is None else value.lower() in TRUE_VALUES
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment."""
+    value = _ENV.get(name)
+    return default if value is None else int(value)
+
+
+def _env_optional_int(name: str) -> int | None:
+    """Read an optional integer setting from the environment."""
+    value = _ENV.get(name)
+    return None if value is None else int(value)
+
+
+class ViteSettings(Struct, frozen=True, gc=False):
     """Server configurations."""
 
-    DEV_MODE: bool = field(
-        default_factory=lambda: os.getenv("VITE_DEV_MODE", "False") in TRUE_VALUES,
-    )
+    DEV_MODE: bool = False
     """Start ``vite`` development server."""
-    USE_SERVER_LIFESPAN: bool = field(
-        default_factory=lambda: os.getenv("VITE_USE_SERVER_LIFESPAN", "True") in TRUE_VALUES,
-    )
+    USE_SERVER_LIFESPAN: bool = True
     """Auto start and stop ``vite`` processes when running in development mode.."""
-    HOST: str = field(default_factory=lambda: os.getenv("VITE_HOST", "0.0.0.0"))  # noqa: S104
+    HOST: str = "0.0.0.0"  # noqa: S104
     """The host the ``vite`` process will listen on.  Defaults to ``0.0.0.0``"""
-    PORT: int = field(default_factory=lambda: int(os.getenv("VITE_PORT", "5173")))
+    PORT: int = 5173
     """The port to start vite on.  Default to ``5173``"""
-    HOT_RELOAD: bool = field(
-        default_factory=lambda: os.getenv("VITE_HOT_RELOAD", "True") in TRUE_VALUES,
-    )
+    HOT_RELOAD: bool = True
     """Start ``vite`` with HMR enabled."""
-    ENABLE_REACT_HELPERS: bool = field(
-        default_factory=lambda: os.getenv("VITE_ENABLE_REACT_HELPERS", "True") in TRUE_VALUES,
-    )
+    ENABLE_REACT_HELPERS: bool = True
     """Enable React support in HMR."""
-    BUNDLE_DIR: Path = field(default_factory=lambda: Path(f"{BASE_DIR}/applets/core/public"))
+    BUNDLE_DIR: Path = _BUNDLE_DIR
     """Bundle directory"""
-    RESOURCE_DIR: Path = field(default_factory=lambda: Path("resources"))
+    RESOURCE_DIR: Path = _RESOURCE_DIR
     """Resource directory"""
-    TEMPLATE_DIR: Path = field(default_factory=lambda: Path(f"{BASE_DIR}/applets/core/templates"))
+    TEMPLATE_DIR: Path = _TEMPLATE_DIR
     """Template directory."""
-    ASSET_URL: str = field(default_factory=lambda: os.getenv("ASSET_URL", "/static/"))
+    ASSET_URL: str = "/static/"
     """Base URL for assets"""
 
+    @classmethod
+    def build(cls) -> ViteSettings:
+        """Build the settings from environment variables.
+
+        Returns:
+            ViteSettings: Vite settings.
+        """
+        return cls(
+            DEV_MODE=_env_bool("VITE_DEV_MODE", default=False),
+            USE_SERVER_LIFESPAN=_env_bool("VITE_USE_SERVER_LIFESPAN", default=True),
+            HOST=_env_str("VITE_HOST", "0.0.0.0"),  # noqa: S104
+            PORT=_env_int("VITE_PORT", 5173),
+            HOT_RELOAD=_env_bool("VITE_HOT_RELOAD", default=True),
+            ENABLE_REACT_HELPERS=_env_bool("VITE_ENABLE_REACT_HELPERS", default=True),
+            ASSET_URL=_env_str("ASSET_URL", "/static/"),
+        )
+
     @property
     def set_static_files(self) -> bool:
         """Serve static assets.
@@ -67,118 +129,137 @@ class ViteSettings:
         return self.ASSET_URL.startswith("/")
 
 
-@dataclass
-class ServerSettings:
+class ServerSettings(Struct, frozen=True, gc=False):
     """Server configurations."""
 
     APP_LOC: str = "app.asgi:app"
     """Path to app executable, or factory."""
     APP_LOC_IS_FACTORY: bool = False
     """Indicate if APP_LOC points to an executable or factory."""
-    HOST: str = field(default_factory=lambda: os.getenv("LITESTAR_HOST", "0.0.0.0"))  # noqa: S104
+    HOST: str = "0.0.0.0"  # noqa: S104
     """Server network host."""
-    PORT: int = field(default_factory=lambda: int(os.getenv("LITESTAR_PORT", "8000")))
+    PORT: int = 8000
     """Server port."""
-    KEEPALIVE: int = field(default_factory=lambda: int(os.getenv("LITESTAR_KEEPALIVE", "65")))
+    KEEPALIVE: int = 65
     """Seconds to hold connections open (65 is > AWS lb idle timeout)."""
-    RELOAD: bool = field(
-        default_factory=lambda: os.getenv("LITESTAR_RELOAD", "False") in TRUE_VALUES,
-    )
+    RELOAD: bool = False
     """Turn on hot reloading."""
-    RELOAD_DIRS: list[str] = field(default_factory=lambda: [f"{BASE_DIR}"])
+    RELOAD_DIRS: list[str] = field(default_factory=lambda: [str(BASE_DIR)])
     """Directories to watch for reloading."""
-    HTTP_WORKERS: int | None = field(
-        default_factory=lambda: int(os.getenv("WEB_CONCURRENCY")) if os.getenv("WEB_CONCURRENCY") is not None else None,
-        # type: ignore[arg-type]
-    )
+    HTTP_WORKERS: int | None = None
     """Number of HTTP Worker processes to be spawned by Uvicorn."""
 
+    @classmethod
+    def build(cls) -> ServerSettings:
+        """Build the settings from environment variables.
+
+        Returns:
+            ServerSettings: Server settings.
+        """
+        return cls(
+            HOST=_env_str("LITESTAR_HOST", "0.0.0.0"),  # noqa: S104
+            PORT=_env_int("LITESTAR_PORT", 8000),
+            KEEPALIVE=_env_int("LITESTAR_KEEPALIVE", 65),
+            RELOAD=_env_bool("LITESTAR_RELOAD", default=False),
+            HTTP_WORKERS=_env_optional_int("WEB_CONCURRENCY"),
+        )
+
 
-@dataclass
-class LogSettings:
+class LogSettings(Struct, frozen=True, gc=False):
     """Logger configuration."""
 
-    # https://stackoverflow.com/a/1845097/6560549
-    EXCLUDE_PATHS: str = r"\A(?!x)x"
+    EXCLUDE_PATHS: str = _NEVER_MATCH.pattern
     """Regex to exclude paths from logging."""
     HTTP_EVENT: str = "HTTP"
     """Log event name for logs from Litestar handlers."""
     INCLUDE_COMPRESSED_BODY: bool = False
     """Include ``body`` of compressed responses in log output."""
-    LEVEL: int = field(default_factory=lambda: int(os.getenv("LOG_LEVEL", "10")))
+    LEVEL: int = 10
     """Stdlib log levels.
 
     Only emit logs at this level, or higher.
     """
-    OBFUSCATE_COOKIES: set[str] = field(default_factory=lambda: {"session"})
+    OBFUSCATE_COOKIES: frozenset[str] = _OBFUSCATE_COOKIES
     """Request cookie keys to obfuscate."""
-    OBFUSCATE_HEADERS: set[str] = field(default_factory=lambda: {"Authorization", "X-API-KEY"})
-    """Request header keys to obfuscate."""
-    REQUEST_FIELDS: list[RequestExtractorField] = field(
-        default_factory=lambda: [
-            "path",
-            "method",
-            "headers",
-            "cookies",
-            "query",
-            "path_params",
-            "body",
-        ],
-    )
+    OBFUSCATE_HEADERS: frozenset[str] = _OBFUSCATE_HEADERS
+    """Request header keys to obfuscate, lowercased."""
+    REQUEST_FIELDS: tuple[RequestExtractorField, ...] = _REQUEST_FIELDS
     """Attributes of the `~litestar.connection.request.Request`_ to be logged."""
-    RESPONSE_FIELDS: list[ResponseExtractorField] = field(
-        default_factory=lambda: [
-            "status_code",
-            "cookies",
-            "headers",
-            "body",
-        ],
-    )
+    RESPONSE_FIELDS: tuple[ResponseExtractorField, ...] = _RESPONSE_FIELDS
     """Attributes of the `~litestar.response.Response`_ to be logged."""
     GRANIAN_ACCESS_LEVEL: int = 30
     """Level to log uvicorn access logs."""
     GRANIAN_ERROR_LEVEL: int = 20
     """Level to log uvicorn error logs."""
 
+    @classmethod
+    def build(cls) -> LogSettings:
+        """Build the settings from environment variables.
+
+        Returns:
+            LogSettings: Log settings.
+        """
+        return cls(LEVEL=_env_int("LOG_LEVEL", 10))
+
 
-@dataclass
-class AppSettings:
+class AppSettings(Struct, frozen=True, gc=False):
     """Application configuration."""
 
-    URL: str = field(default_factory=lambda: os.getenv("APP_URL", "http://localhost:8000"))
+    URL: str = "http://localhost:8000"
     """The frontend base URL"""
-    DEBUG: bool = field(default_factory=lambda: os.getenv("LITESTAR_DEBUG", "False") in TRUE_VALUES)
+    DEBUG: bool = False
     """Run ``Litestar`` with ``debug=True``."""
-    SECRET_KEY: str = field(
-        default_factory=lambda: os.getenv("SECRET_KEY", binascii.hexlify(os.urandom(32)).decode(encoding="utf-8")),
-    )
-    """Application secret key."""
-    NAME: str = field(default_factory=lambda: "python-source-builder")
+    SECRET_KEY: str | None = None
+    """Application secret key. Prefer :attr:`secret_key`, which falls back to a generated key."""
+    NAME: str = "python-source-builder"
     """Application name."""
 
+    @classmethod
+    def build(cls) -> AppSettings:
+        """Build the settings from environment variables.
+
+        Returns:
+            AppSettings: Application settings.
+        """
+        return cls(
+            URL=_env_str("APP_URL", "http://localhost:8000"),
+            DEBUG=_env_bool("LITESTAR_DEBUG", default=False),
+            SECRET_KEY=_ENV.get("SECRET_KEY"),
+        )
+
+    @property
+    def secret_key(self) -> str:
+        """Application secret key.
+
+        Returns:
+            str: ``SECRET_KEY`` if set, otherwise a random key generated once per process.
+        """
+        return self.SECRET_KEY or _generate_secret_key()
+
 
-@dataclass
-class TemplateSettings:
+class TemplateSettings(Struct, frozen=True, gc=False):
     """Configures Templating for the project."""
 
     ENGINE: type[JinjaTemplateEngine] = JinjaTemplateEngine
     """Template engine to use. (Jinja2 or Mako)"""
 
 
-@dataclass
-class Settings:
+class Settings(Struct, frozen=True, gc=False):
     """Application settings."""
 
-    app: AppSettings = field(default_factory=AppSettings)
+    app: AppSettings = field(default_factory=AppSettings.build)
     template: TemplateSettings = field(default_factory=TemplateSettings)
-    vite: ViteSettings = field(default_factory=ViteSettings)
-    server: ServerSettings = field(default_factory=ServerSettings)
-    log: LogSettings = field(default_factory=LogSettings)
+    vite: ViteSettings = field(default_factory=ViteSettings.build)
+    server: ServerSettings = field(default_factory=ServerSettings.build)
+    log: LogSettings = field(default_factory=LogSettings.build)
 
     @classmethod
+    @lru_cache(maxsize=8)
     def from_env(cls, dotenv_filename: str = ".env") -> Settings:
         """Load settings from environment variables.
 
+        Results are cached per ``dotenv_filename``.
+
         Args:
             dotenv_filename (str): The name of the dotenv file to load.
                 Assumes ``curdir`` but can pass the rest of the path.
@@ -186,24 +267,38 @@ class Settings:
         Returns:
             Settings: Application settings
         """
-        # noinspection PyProtectedMember
-        from litestar.cli._utils import console
-
-        env_file = Path(f"{os.curdir}/{dotenv_filename}")
+        env_file = Path(dotenv_filename)
         if env_file.is_file():
-            from dotenv import load_dotenv
+            # noinspection PyProtectedMember
+            from litestar.cli._utils import console
+
+            try:
+                from dotenv import load_dotenv
+            except ImportError:
+                console.print(f"[red]python-dotenv is not installed, skipping {dotenv_filename}[/]")
+            else:
+                console.print(f"[yellow]Loading environment configuration from {dotenv_filename}[/]")
+
+                load_dotenv(env_file, override=True)
+        return Settings(
+            app=AppSettings.build(),
+            template=TemplateSettings(),
+            vite=ViteSettings.build(),
+            server=ServerSettings.build(),
+            log=LogSettings.build(),
+        )
 
-            console.print(f"[yellow]Loading environment configuration from {dotenv_filename}[/]")
 
-            load_dotenv(env_file, override=True)
-        return Settings()
+_SETTINGS: Settings | None = None
 
 
-@lru_cache(maxsize=1, typed=True)
 def get_settings() -> Settings:
     """Helper function to get settings from elsewhere.
 
     Returns:
         Settings: Application settings
     """
-    return Settings.from_env()
+    global _SETTINGS  # noqa: PLW0603
+    if _SETTINGS is None:
+        _SETTINGS = Settings.from_env()
+    return _SETTINGS
@@ -1,14 +1,67 @@
 """App-wide utilities."""
 
+import os
+import sys
+from collections.abc import Iterator
+from functools import cache
 from pathlib import Path
 
+_APPLETS_DIR = Path(__file__).parent / "applets"
+_TEMPLATES = sys.intern("templates")
+_SKIP_DIRS = frozenset(
+    map(sys.intern, (".git", "__pycache__", "node_modules", ".venv", "_build", "dist", ".mypy_cache", ".ruff_cache"))
+)
 
-def get_template_directories() -> list[str]:
-    """Recurses throughout the app structure to find directories named "templates".
+
+def _scandir_dirs(path: str) -> Iterator[str]:
+    """Recursively yield directories named "templates" below ``path``.
+
+    Symlinks and well-known tool/build directories are not descended into.
+
+    Args:
+        path (str): Directory to start from.
+
+    Yields:
+        str: Path of each template directory found.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_symlink() or not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name == _TEMPLATES:
+                yield entry.path
+            elif entry.name not in _SKIP_DIRS:
+                yield from _scandir_dirs(entry.path)
+
+
+def _applet_template_dirs(path: str) -> Iterator[str]:
+    """Yield the "templates" directory of each applet directly below ``path``.
+
+    Args:
+        path (str): The applets package directory.
+
+    Yields:
+        str: Path of each applet template directory found.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                templates = os.path.join(entry.path, _TEMPLATES)  # noqa: PTH118
+                if os.path.isdir(templates):  # noqa: PTH112
+                    yield templates
+
+
+@cache
+def get_template_directories() -> tuple[str, ...]:
+    """Find the template directories of every applet.
+
+    Templates live at ``applets/<applet>/templates``, so only the applets package is scanned. The whole app tree is
+    walked instead if the applets package is missing. The source tree does not change at runtime, so the result is
+    cached for the life of the process.
 
     Returns:
-        list[str]: List of template directories.
+        tuple[str, ...]: Template directories.
     """
-    current_dir = Path(__file__).parent
-    template_dirs = list(current_dir.rglob("templates"))
-    return [str(template_dir) for template_dir in template_dirs]
+    if _APPLETS_DIR.is_dir():
+        return tuple(_applet_template_dirs(str(_APPLETS_DIR)))
+    return tuple(_scandir_dirs(str(Path(__file__).parent)))
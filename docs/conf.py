@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import warnings
-from datetime import datetime
 
 from app.__metadata__ import __project__
 
@@ -12,11 +11,11 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)  # RemovedInSphin
 
 # -- Project information -----------------------------------------------------
 project = __project__
-copyright = f"{datetime.now().year} Jacob Coffee"
+copyright = "%Y Jacob Coffee"
 author = "Jacob Coffee"
 
 # -- General configuration ---------------------------------------------------
-extensions = [
+extensions = (
     "sphinx.ext.intersphinx",
     "sphinx.ext.autosectionlabel",
     "sphinx.ext.autodoc",
@@ -27,7 +26,7 @@ extensions = [
     "sphinx_click",
     "sphinx_toolbox.collapse",
     "sphinx_design",
-]
+)
 
 exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 
@@ -89,9 +88,7 @@ todo_include_todos = True
 # -- Style configuration -----------------------------------------------------
 html_theme = "shibuya"
 html_static_path = ["_static"]
-html_css_files = [
-    "custom.css",
-]
+html_css_files = ("custom.css",)
 html_show_sourcelink = True
 html_title = "Docs"
 html_favicon = "_static/badge.svg"
@@ -0,0 +1,44 @@
+"""Tests for the core applet controller."""
+
+import pytest
+
+from app.applets.core.controller import _accepts_gzip, _etag_matches
+
+ETAG = '"59527cafbcf5afdb"'
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip", True),
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, GZIP;q=0.5", True),
+        ("x-gzip", True),
+        ("*", True),
+        ("", False),
+        ("br", False),
+        ("identity", False),
+        ("gzip;q=0", False),
+        ("gzip; q=0.000", False),
+        ("*, gzip;q=0", False),
+        ("gzip;q=bogus", False),
+    ],
+)
+def test_accepts_gzip(accept_encoding: str, expected: bool) -> None:
+    assert _accepts_gzip(accept_encoding) is expected
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (ETAG, True),
+        (f'"other", {ETAG}', True),
+        (f"W/{ETAG}", True),
+        ("*", True),
+        ("", False),
+        ('"other"', False),
+        (ETAG.strip('"'), False),
+    ],
+)
+def test_etag_matches(if_none_match: str, expected: bool) -> None:
+    assert _etag_matches(if_none_match, ETAG) is expected
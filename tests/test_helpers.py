@@ -0,0 +1,132 @@
+"""Tests for the core applet helpers."""
+
+import asyncio
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from app.applets.core import helpers
+from app.applets.core.helpers import (
+    VersionTuple,
+    _release_order,
+    get_latest_version,
+    get_version_from_tags,
+    get_versions_for_api,
+    initialize_database,
+    parse_version,
+)
+
+
+def _versions(*versions: str) -> list[VersionTuple]:
+    """Parse release versions the way they arrive from GitHub tags."""
+    return get_version_from_tags([{"ref": f"refs/tags/v{version}"} for version in versions])
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [
+        ("3.12.7", (3, 12, 7, None)),
+        ("3.14.0a1", (3, 14, 0, ("a", 1))),
+        ("3.13.0b4", (3, 13, 0, ("b", 4))),
+        ("3.13.0rc10", (3, 13, 0, ("rc", 10))),
+        ("3.9.20", (3, 9, 20, None)),
+    ],
+)
+def test_parse_version(version: str, expected: tuple) -> None:
+    assert parse_version(version) == expected
+
+
+@pytest.mark.parametrize(
+    "version", ["", "3.12", "3.12.7.1", "3.12.7c1", "3.12.7rc", "v3.12.7", "3.12.7 ", "legacy-trunk"]
+)
+def test_parse_version_rejects_non_releases(version: str) -> None:
+    assert parse_version(version) is None
+
+
+def test_release_order() -> None:
+    versions = _versions("3.13.0", "3.13.0rc10", "3.12.7", "3.13.0a1", "3.13.0rc2", "3.13.0b3", "3.13.1", "3.12.10")
+    ordered = sorted(versions, key=_release_order)
+    assert ordered == [
+        (3, 12, 7, None),
+        (3, 12, 10, None),
+        (3, 13, 0, ("a", 1)),
+        (3, 13, 0, ("b", 3)),
+        (3, 13, 0, ("rc", 2)),
+        (3, 13, 0, ("rc", 10)),
+        (3, 13, 0, None),
+        (3, 13, 1, None),
+    ]
+
+
+def test_get_version_from_tags() -> None:
+    tags = [
+        {"ref": "refs/tags/v3.12.7"},
+        {"ref": "refs/tags/v3.13.0rc2"},
+        {"ref": "refs/tags/legacy-trunk"},
+        {"ref": "refs/tags/v3.13.0-final"},
+        {"ref": "refs/heads/main"},
+        {},
+    ]
+    assert get_version_from_tags(tags) == [(3, 12, 7, None), (3, 13, 0, ("rc", 2))]
+
+
+def test_get_latest_version() -> None:
+    versions = _versions("3.13.0rc10", "3.13.0rc2", "3.12.7", "3.12.10", "3.8.20", "2.7.18", "3.14.0a1", "3.11.0")
+    assert get_latest_version(versions) == {
+        "3.13": (3, 13, 0, ("rc", 10)),
+        "3.12": (3, 12, 10, None),
+        "3.11": (3, 11, 0, None),
+    }
+
+
+def test_get_latest_version_prefers_final_release() -> None:
+    versions = _versions("3.13.0rc2", "3.13.0", "3.13.0rc10")
+    assert get_latest_version(versions) == {"3.13": (3, 13, 0, None)}
+
+
+@pytest.fixture
+def database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the helpers at an empty database file with cold caches."""
+    path = tmp_path / "python_versions.db"
+    monkeypatch.setattr(helpers, "DATABASE_FILE", str(path))
+    monkeypatch.setattr(helpers, "_VERSIONS_CACHE", None)
+    monkeypatch.setattr(helpers, "_TEMPLATE_VERSIONS_CACHE", None)
+    return path
+
+
+def test_initialize_database_migrates_text_timestamps(database: Path) -> None:
+    with sqlite3.connect(database) as db:
+        db.execute("""
+            CREATE TABLE python_versions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE,
+                major INTEGER,
+                minor INTEGER,
+                patch INTEGER,
+                level TEXT,
+                status TEXT,
+                last_updated TIMESTAMP
+            )
+        """)
+        db.executemany(
+            "INSERT INTO python_versions (name, major, minor, patch, level, status, last_updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                ("Python 3.12.7", 3, 12, 7, "final", "bugfix", "2024-10-01T12:34:56.123456+00:00"),
+                ("Python 3.11.10", 3, 11, 10, "final", "bugfix", "not a timestamp"),
+            ],
+        )
+    db.close()
+
+    asyncio.run(initialize_database())
+
+    with sqlite3.connect(database) as db:
+        rows = db.execute("SELECT name, last_updated, typeof(last_updated) FROM python_versions").fetchall()
+    db.close()
+    assert rows == [("Python 3.12.7", 1727786096, "integer")]
+
+    versions = asyncio.run(get_versions_for_api())
+    assert [version.name for version in versions] == ["Python 3.12.7"]
+    assert versions[0].last_updated == datetime(2024, 10, 1, 12, 34, 56, tzinfo=UTC)
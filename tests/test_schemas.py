@@ -0,0 +1,31 @@
+"""Tests for the core applet schemas."""
+
+import msgspec
+import pytest
+
+from app.applets.core.schemas import ScriptData, script_data_from_form
+
+BOOL_FIELDS = [field.name for field in msgspec.structs.fields(ScriptData) if field.type is bool]
+
+
+def test_script_data_from_form_defaults() -> None:
+    assert script_data_from_form({}) == ScriptData()
+
+
+@pytest.mark.parametrize("field", BOOL_FIELDS)
+@pytest.mark.parametrize("value", ["on", "true", "1"])
+def test_script_data_from_form_checked(field: str, value: str) -> None:
+    script_data = script_data_from_form({field: value})
+    assert getattr(script_data, field) is True
+    assert all(getattr(script_data, name) is False for name in BOOL_FIELDS if name != field)
+
+
+@pytest.mark.parametrize("value", ["off", "false", ""])
+def test_script_data_from_form_unchecked(value: str) -> None:
+    assert script_data_from_form({"useAllCPUs": value}).useAllCPUs is False
+
+
+def test_script_data_from_form_strings() -> None:
+    script_data = script_data_from_form({"selectedVersion": "3.12.7", "prefixPath": "/usr/local/", "unknown": "x"})
+    assert script_data.selectedVersion == "3.12.7"
+    assert script_data.prefixPath == "/usr/local/"